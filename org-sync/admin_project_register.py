@@ -17,17 +17,111 @@ Required environment variables:
 Optional environment variables:
   ADMIN_REPO  — Admin control plane repository name
                 (default: infinity-admin-control-plane)
+
+Resolved org and project node IDs are cached in .github/.admin_cache.json
+for 24 hours, so repeat registrations skip the project lookup. REST GETs are
+conditional on the ETags kept in .github/.admin_etags.json.
 """
 
+import base64
 import json
 import os
+import stat
 import sys
 import datetime
-import urllib.request
-import urllib.error
+import tempfile
+import time
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is the fallback
+    orjson = None
 
 GH_GRAPHQL = "https://api.github.com/graphql"
 GH_REST    = "https://api.github.com"
+CACHE_FILE = ".github/.admin_cache.json"
+CACHE_TTL  = datetime.timedelta(hours=24)
+ETAG_FILE  = ".github/.admin_etags.json"
+_RETRY_STATUSES = frozenset({502, 503, 504})
+
+# One pooled session for the whole registration run: every GraphQL/REST call
+# goes to api.github.com, so reusing the connection skips a TLS handshake per call.
+# requests sends "Accept-Encoding: gzip, deflate" by default and decodes the
+# body transparently, so GraphQL responses arrive compressed.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        # urllib3 retries idempotent methods (GET) on these statuses. With
+        # raise_on_status=False the last response is returned, so callers'
+        # resp.ok handling still runs. POSTs are never retried here; see _post_gql.
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=_RETRY_STATUSES,
+            raise_on_status=False,
+        ),
+    ),
+)
+
+
+# ─── JSON / time helpers ───────────────────────────────────────────────────
+
+def _dumps(obj, indent: bool = False) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode()
+
+
+def _loads(data: bytes | str):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dig(obj, *keys, default=None):
+    """Walk nested dicts by key; return default on a missing key or a null."""
+    for key in keys:
+        if not isinstance(obj, dict):
+            return default
+        obj = obj.get(key)
+    return default if obj is None else obj
+
+
+def _utcnow_z() -> str:
+    return datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+# Read once at import: os.umask can only be queried by setting it.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write via a synced temp file and os.replace, so a killed job never leaves a torn cache."""
+    try:
+        mode = stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        mode = 0o666 & ~_UMASK
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+            fh.flush()
+            getattr(os, "fdatasync", os.fsync)(fh.fileno())
+        # mkstemp creates 0600; keep the target's mode (os.chmod works on Windows too).
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
 
 
 # ─── HTTP helpers ──────────────────────────────────────────────────────────
@@ -41,99 +135,188 @@ def _headers(token: str) -> dict:
     }
 
 
+def _post_gql(body: bytes, headers: dict, query: str) -> requests.Response:
+    """POST a GraphQL request, retrying read-only queries on a 502/503/504.
+
+    Mutations are sent once: repeating one after a gateway error could apply
+    it twice.
+    """
+    attempts = 1 if query.lstrip().startswith("mutation") else 3
+    for attempt in range(attempts):
+        resp = _SESSION.post(GH_GRAPHQL, data=body, headers=headers, timeout=30)
+        if resp.status_code not in _RETRY_STATUSES or attempt == attempts - 1:
+            return resp
+        time.sleep(0.3 * 2**attempt)
+
+
 def gql(token: str, query: str, variables: dict) -> dict:
-    payload = json.dumps({"query": query, "variables": variables}).encode()
-    req = urllib.request.Request(
-        GH_GRAPHQL,
-        data=payload,
-        headers=_headers(token),
-        method="POST",
-    )
-    try:
-        with urllib.request.urlopen(req, timeout=30) as resp:  # noqa: S310
-            data = json.loads(resp.read())
-            if "errors" in data:
-                print(f"[admin_register] GraphQL errors: {data['errors']}", file=sys.stderr)
-            return data
-    except urllib.error.HTTPError as exc:
-        body = exc.read().decode("utf-8", errors="replace")
-        print(f"[admin_register] GraphQL HTTP {exc.code}: {body}", file=sys.stderr)
+    resp = _post_gql(_dumps({"query": query, "variables": variables}), _headers(token), query)
+    if not resp.ok:
+        print(f"[admin_register] GraphQL HTTP {resp.status_code}: {resp.text}", file=sys.stderr)
         return {}
+    data = _loads(resp.content)
+    if "errors" in data:
+        print(f"[admin_register] GraphQL errors: {data['errors']}", file=sys.stderr)
+    return data
 
 
 def rest_post(token: str, path: str, payload: dict) -> dict | None:
-    url = f"{GH_REST}{path}"
-    data = json.dumps(payload).encode()
-    req = urllib.request.Request(url, data=data, headers=_headers(token), method="POST")
-    try:
-        with urllib.request.urlopen(req, timeout=30) as resp:  # noqa: S310
-            return json.loads(resp.read())
-    except urllib.error.HTTPError as exc:
-        body = exc.read().decode("utf-8", errors="replace")
-        print(f"[admin_register] REST POST {path} HTTP {exc.code}: {body}", file=sys.stderr)
+    resp = _SESSION.post(
+        f"{GH_REST}{path}", data=_dumps(payload), headers=_headers(token), timeout=30
+    )
+    if not resp.ok:
+        print(
+            f"[admin_register] REST POST {path} HTTP {resp.status_code}: {resp.text}",
+            file=sys.stderr,
+        )
         return None
+    return _loads(resp.content)
 
 
-def rest_get(token: str, path: str) -> dict | list | None:
-    url = f"{GH_REST}{path}"
-    req = urllib.request.Request(url, headers=_headers(token), method="GET")
+def _load_etags() -> dict:
     try:
-        with urllib.request.urlopen(req, timeout=30) as resp:  # noqa: S310
-            return json.loads(resp.read())
-    except urllib.error.HTTPError as exc:
-        if exc.code == 404:
-            return None
-        body = exc.read().decode("utf-8", errors="replace")
-        print(f"[admin_register] REST GET {path} HTTP {exc.code}: {body}", file=sys.stderr)
+        etags = _loads(Path(ETAG_FILE).read_bytes())
+    except (FileNotFoundError, ValueError):
+        return {}
+    # Keep only the ETag and blob sha, even from an older sidecar that stored bodies.
+    return {
+        path: {"etag": entry["etag"], "sha": entry.get("sha")}
+        for path, entry in etags.items()
+        if isinstance(entry, dict) and entry.get("etag")
+    }
+
+
+def _save_etags(etags: dict) -> None:
+    path = Path(ETAG_FILE)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _write_atomic(path, _dumps(etags))
+
+
+def rest_get(token: str, path: str, conditional: bool = True) -> dict | list | None:
+    """GET a REST resource.
+
+    With conditional=True the request carries If-None-Match from the ETag
+    sidecar. A 304 reply has an empty body and does not count against the
+    primary rate limit; it returns {"sha": <cached sha>} only. The sidecar
+    is persisted through actions/cache, so it holds just the ETag and sha and
+    never a response body. Callers that need the content use conditional=False.
+    """
+    etags = _load_etags() if conditional else {}
+    cached = etags.get(path)
+    headers = _headers(token)
+    if cached:
+        headers["If-None-Match"] = cached["etag"]
+
+    resp = _SESSION.get(f"{GH_REST}{path}", headers=headers, timeout=30)
+    if resp.status_code == 304 and cached:
+        return {"sha": cached["sha"]}
+    if resp.status_code == 404:
+        if cached:
+            del etags[path]
+            _save_etags(etags)
+        return None
+    if not resp.ok:
+        print(
+            f"[admin_register] REST GET {path} HTTP {resp.status_code}: {resp.text}",
+            file=sys.stderr,
+        )
         return None
 
+    body = _loads(resp.content)
+    if conditional and resp.headers.get("ETag"):
+        etags[path] = {
+            "etag": resp.headers["ETag"],
+            "sha": body.get("sha") if isinstance(body, dict) else None,
+        }
+        _save_etags(etags)
+    return body
 
-# ─── Step 1: Get org node ID ────────────────────────────────────────────────
 
-def get_org_node_id(token: str, org: str) -> str | None:
-    query = """
-    query($login: String!) {
-      organization(login: $login) { id }
+# ─── ID cache ────────────────────────────────────────────────────────────────
+
+def load_cached_ids(org: str, admin_repo: str) -> dict | None:
+    """Return the cached org/project node IDs if present and younger than CACHE_TTL."""
+    try:
+        cache = _loads(Path(CACHE_FILE).read_bytes())
+        entry = cache[f"{org}/{admin_repo}"]
+        fetched_at = datetime.datetime.fromisoformat(entry["fetched_at"])
+    except (FileNotFoundError, KeyError, TypeError, ValueError):
+        return None
+    if datetime.datetime.now(datetime.timezone.utc) - fetched_at > CACHE_TTL:
+        return None
+    if not entry.get("org_node_id") or not entry.get("project_id"):
+        return None
+    return entry
+
+
+def save_cached_ids(org: str, admin_repo: str, org_node_id: str, project_id: str) -> None:
+    path = Path(CACHE_FILE)
+    try:
+        cache = _loads(path.read_bytes())
+    except (FileNotFoundError, ValueError):
+        cache = {}
+    cache[f"{org}/{admin_repo}"] = {
+        "org_node_id": org_node_id,
+        "project_id": project_id,
+        "fetched_at": _utcnow_z(),
     }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _write_atomic(path, _dumps(cache, indent=True))
+
+
+# ─── Step 1: Resolve org, project and repository IDs ────────────────────────
+
+def resolve_ids(
+    token: str, org: str, repo: str, project_title: str
+) -> tuple[str | None, str | None, str | None]:
+    """Return (org_node_id, project_id, repo_node_id) using one aliased query.
+
+    Further pages of projects are only requested when the org has more than
+    100 projects and the title was not found on the first page.
     """
-    result = gql(token, query, {"login": org})
-    return result.get("data", {}).get("organization", {}).get("id")
-
-
-# ─── Step 2: Find or create the admin project ───────────────────────────────
-
-def find_or_create_project(token: str, org_node_id: str, project_title: str) -> str | None:
-    """Return the project node ID, creating it if it doesn't exist."""
-    list_query = """
-    query($orgId: ID!, $cursor: String) {
-      node(id: $orgId) {
-        ... on Organization {
-          projectsV2(first: 50, after: $cursor) {
-            nodes { id title }
-            pageInfo { hasNextPage endCursor }
-          }
+    query = """
+    query($org: String!, $repo: String!, $cursor: String) {
+      org: organization(login: $org) {
+        id
+        projectsV2(first: 100, after: $cursor) {
+          nodes { id title }
+          pageInfo { hasNextPage endCursor }
         }
       }
+      repo: repository(owner: $org, name: $repo) { id }
     }
     """
+    org_node_id = repo_node_id = None
     cursor = None
     while True:
-        result = gql(token, list_query, {"orgId": org_node_id, "cursor": cursor})
-        projects = (
-            result.get("data", {})
-            .get("node", {})
-            .get("projectsV2", {})
-        )
-        for p in projects.get("nodes", []):
+        result = gql(token, query, {"org": org, "repo": repo, "cursor": cursor})
+        org_node_id = org_node_id or _dig(result, "data", "org", "id")
+        repo_node_id = repo_node_id or _dig(result, "data", "repo", "id")
+
+        projects = _dig(result, "data", "org", "projectsV2", default={})
+        for p in projects.get("nodes") or []:
             if p["title"] == project_title:
                 print(f"[admin_register] Found existing project: {project_title} ({p['id']})")
-                return p["id"]
-        page_info = projects.get("pageInfo", {})
-        if not page_info.get("hasNextPage"):
-            break
-        cursor = page_info.get("endCursor")
+                return org_node_id, p["id"], repo_node_id
+        if not _dig(projects, "pageInfo", "hasNextPage"):
+            return org_node_id, None, repo_node_id
+        cursor = _dig(projects, "pageInfo", "endCursor")
+
 
-    # Create new project
+def get_repo_node_id(token: str, org: str, repo: str) -> str | None:
+    query = """
+    query($owner: String!, $name: String!) {
+      repository(owner: $owner, name: $name) { id }
+    }
+    """
+    result = gql(token, query, {"owner": org, "name": repo})
+    return _dig(result, "data", "repository", "id")
+
+
+# ─── Step 2: Create the admin project ───────────────────────────────────────
+
+def create_project(token: str, org_node_id: str, project_title: str) -> str | None:
+    """Create the admin project and return its node ID."""
     create_mutation = """
     mutation($orgId: ID!, $title: String!) {
       createProjectV2(input: {ownerId: $orgId, title: $title}) {
@@ -142,28 +325,16 @@ def find_or_create_project(token: str, org_node_id: str, project_title: str) ->
     }
     """
     result = gql(token, create_mutation, {"orgId": org_node_id, "title": project_title})
-    project = result.get("data", {}).get("createProjectV2", {}).get("projectV2", {})
-    if project.get("id"):
-        print(f"[admin_register] Created project: {project_title} ({project['id']})")
-        return project["id"]
+    project_id = _dig(result, "data", "createProjectV2", "projectV2", "id")
+    if project_id:
+        print(f"[admin_register] Created project: {project_title} ({project_id})")
+        return project_id
 
     print(f"[admin_register] ERROR: Could not create project '{project_title}'", file=sys.stderr)
     return None
 
 
-# ─── Step 3: Get repository node ID ─────────────────────────────────────────
-
-def get_repo_node_id(token: str, org: str, repo: str) -> str | None:
-    query = """
-    query($owner: String!, $name: String!) {
-      repository(owner: $owner, name: $name) { id }
-    }
-    """
-    result = gql(token, query, {"owner": org, "name": repo})
-    return result.get("data", {}).get("repository", {}).get("id")
-
-
-# ─── Step 4: Link repository to project ─────────────────────────────────────
+# ─── Step 3: Link repository to project ─────────────────────────────────────
 
 def link_repo_to_project(token: str, project_id: str, repo_node_id: str) -> bool:
     mutation = """
@@ -174,15 +345,15 @@ def link_repo_to_project(token: str, project_id: str, repo_node_id: str) -> bool
     }
     """
     result = gql(token, mutation, {"projectId": project_id, "contentId": repo_node_id})
-    item = result.get("data", {}).get("addProjectV2ItemById", {}).get("item", {})
-    if item.get("id"):
-        print(f"[admin_register] Repository linked to project (item: {item['id']})")
+    item_id = _dig(result, "data", "addProjectV2ItemById", "item", "id")
+    if item_id:
+        print(f"[admin_register] Repository linked to project (item: {item_id})")
         return True
     print("[admin_register] WARNING: Could not link repository to project.", file=sys.stderr)
     return False
 
 
-# ─── Step 5: Create standard issue template ─────────────────────────────────
+# ─── Step 4: Create standard issue template ─────────────────────────────────
 
 ISSUE_TEMPLATE = """\
 ---
@@ -214,6 +385,7 @@ assignees: []
 
 <!-- Any additional context -->
 """
+ISSUE_TEMPLATE_B64 = base64.b64encode(ISSUE_TEMPLATE.encode()).decode()
 
 
 def create_issue_template(token: str, org: str, repo: str) -> bool:
@@ -224,11 +396,9 @@ def create_issue_template(token: str, org: str, repo: str) -> bool:
         print(f"[admin_register] Issue template already exists: {path}")
         return True
 
-    import base64
-    content_b64 = base64.b64encode(ISSUE_TEMPLATE.encode()).decode()
     payload = {
         "message": "chore: add Singularity Prime state transition issue template",
-        "content": content_b64,
+        "content": ISSUE_TEMPLATE_B64,
     }
     result = rest_post(token, f"/repos/{org}/{repo}/contents/{path}", payload)
     if result:
@@ -238,43 +408,45 @@ def create_issue_template(token: str, org: str, repo: str) -> bool:
     return False
 
 
-# ─── Step 6: Update admin registry JSON ─────────────────────────────────────
+# ─── Step 5: Update admin registry JSON ─────────────────────────────────────
 
 def update_admin_registry(
     token: str, org: str, admin_repo: str, repo: str, project_id: str | None
 ) -> None:
     """Read/create the admin registry JSON and append this repo."""
     registry_path = "registry/repos.json"
-    existing = rest_get(token, f"/repos/{org}/{admin_repo}/contents/{registry_path}")
-
-    import base64
+    # Unconditional: the registry content is needed, and it must not be cached
+    # outside the admin repo.
+    existing = rest_get(
+        token, f"/repos/{org}/{admin_repo}/contents/{registry_path}", conditional=False
+    )
 
     if existing and isinstance(existing, dict) and "content" in existing:
-        raw = base64.b64decode(existing["content"]).decode("utf-8")
-        registry = json.loads(raw)
+        registry = _loads(base64.b64decode(existing["content"]))
         sha = existing["sha"]
     else:
         registry = {"schema_version": "1.0.0", "repos": []}
         sha = None
 
-    # Idempotent: skip if already registered
-    if any(r.get("name") == repo for r in registry.get("repos", [])):
+    # Idempotent: an already-registered repo returns before any encode or write.
+    repos = registry.setdefault("repos", [])
+    registered = {r.get("name") for r in repos}
+    if repo in registered:
         print(f"[admin_register] Repository already in admin registry: {repo}")
         return
 
-    registry.setdefault("repos", []).append(
+    now = _utcnow_z()
+    repos.append(
         {
             "name": repo,
             "org": org,
             "project_id": project_id,
-            "registered_at": datetime.datetime.now(datetime.timezone.utc).isoformat().replace("+00:00", "Z"),
+            "registered_at": now,
         }
     )
-    registry["updated_at"] = datetime.datetime.now(datetime.timezone.utc).isoformat().replace("+00:00", "Z")
+    registry["updated_at"] = now
 
-    new_content = base64.b64encode(
-        json.dumps(registry, indent=2).encode()
-    ).decode()
+    new_content = base64.b64encode(_dumps(registry, indent=True)).decode()
     payload: dict = {
         "message": f"chore: register {org}/{repo} in admin registry",
         "content": new_content,
@@ -313,27 +485,32 @@ def main() -> None:
     print(f"[admin_register] Registering {org}/{repo} in admin control plane…")
 
     # Step 1
-    org_node_id = get_org_node_id(token, org)
-    if not org_node_id:
-        print(f"[admin_register] ERROR: Could not resolve org '{org}'", file=sys.stderr)
-        sys.exit(1)
+    project_title = f"Singularity Prime — {admin_repo}"
+    cached = load_cached_ids(org, admin_repo)
+    if cached:
+        print(f"[admin_register] Using cached project: {project_title} ({cached['project_id']})")
+        org_node_id, project_id = cached["org_node_id"], cached["project_id"]
+        repo_node_id = get_repo_node_id(token, org, repo)
+    else:
+        org_node_id, project_id, repo_node_id = resolve_ids(token, org, repo, project_title)
+        if not org_node_id:
+            print(f"[admin_register] ERROR: Could not resolve org '{org}'", file=sys.stderr)
+            sys.exit(1)
 
-    # Step 2
-    project_id = find_or_create_project(
-        token, org_node_id, f"Singularity Prime — {admin_repo}"
-    )
+        # Step 2
+        if not project_id:
+            project_id = create_project(token, org_node_id, project_title)
+        if project_id:
+            save_cached_ids(org, admin_repo, org_node_id, project_id)
 
     # Step 3
-    repo_node_id = get_repo_node_id(token, org, repo)
-
-    # Step 4
     if project_id and repo_node_id:
         link_repo_to_project(token, project_id, repo_node_id)
 
-    # Step 5
+    # Step 4
     create_issue_template(token, org, repo)
 
-    # Step 6
+    # Step 5
     update_admin_registry(token, org, admin_repo, repo, project_id)
 
     print("[admin_register] Admin registration complete ✓")
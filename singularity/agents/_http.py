@@ -0,0 +1,38 @@
+"""
+_http.py — Singularity Prime shared HTTP session factory
+
+  pooled_session(pool_maxsize, retries) → keep-alive requests.Session
+  RETRY_STATUSES                        → gateway statuses worth retrying
+
+Every agent that talks HTTP builds its session here so the pool and retry
+policy stay in one place. Status retries apply to idempotent methods only
+(urllib3 never retries POST), and raise_on_status=False hands the final
+response back, so callers' resp.ok handling still runs after the retries
+are used up.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+RETRY_STATUSES = frozenset({502, 503, 504})
+
+
+def pooled_session(
+    pool_maxsize: int = 10, retries: int = 0, backoff_factor: float = 0.3
+) -> requests.Session:
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=pool_maxsize,
+            max_retries=Retry(
+                total=retries,
+                backoff_factor=backoff_factor,
+                status_forcelist=RETRY_STATUSES,
+                raise_on_status=False,
+            ),
+        ),
+    )
+    return session
@@ -0,0 +1,105 @@
+"""
+_jsonio.py — Singularity Prime shared JSON helpers
+
+Uses orjson when it is installed and falls back to the stdlib json module
+otherwise, so agents keep running on a bare CI Python.
+
+  dumps(obj, indent=False) → bytes (UTF-8, 2-space indent when requested)
+  loads(data)              → parsed object from bytes or str
+  dig(obj, *keys)          → nested dict lookup that tolerates missing keys/nulls
+  load_json_cached(path)   → parsed file, memoised until its mtime/size changes
+  write_atomic(path, data) → replace a file's bytes so readers never see it half-written
+
+orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can keep
+catching json.JSONDecodeError whichever backend is active.
+"""
+
+import json
+import os
+import stat
+import tempfile
+from functools import lru_cache
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional speed-up
+    orjson = None
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def loads(data: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dig(obj: Any, *keys: str, default: Any = None) -> Any:
+    for key in keys:
+        if not isinstance(obj, dict):
+            return default
+        obj = obj.get(key)
+    return default if obj is None else obj
+
+
+@lru_cache(maxsize=32)
+def _load_file(path: str, mtime_ns: int, size: int) -> Any:
+    with open(path, "rb") as fh:
+        return loads(fh.read())
+
+
+def load_json_cached(path: str | os.PathLike) -> Any:
+    """Parse a JSON file once per version of it within this process.
+
+    The cache key includes the file's mtime and size, so a rewritten file is
+    re-read. The parsed object is shared between callers: treat it as read-only.
+    """
+    path = os.fspath(path)
+    st = os.stat(path)
+    return _load_file(path, st.st_mtime_ns, st.st_size)
+
+
+# fdatasync skips the metadata flush where the OS offers it (not macOS/Windows).
+_datasync = getattr(os, "fdatasync", os.fsync)
+
+# os.umask can only be read by setting it, which is not thread-safe, so read it
+# once at import (agents run concurrently under evolution_engine).
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _target_mode(path: str) -> int:
+    """Permissions for a rewritten file: keep the existing file's, else the umask default."""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+def write_atomic(path: str | os.PathLike, data: bytes) -> None:
+    """Write data to a temp file beside path, sync it, then rename it over path.
+
+    A crash or a concurrent reader sees either the old file or the new one,
+    never a truncated mix. The file keeps its permissions (mkstemp alone
+    would leave it 0600).
+    """
+    path = os.fspath(path)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+            fh.flush()
+            _datasync(fh.fileno())
+        # os.chmod rather than os.fchmod: the latter is missing on Windows before 3.13.
+        os.chmod(tmp, _target_mode(path))
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
@@ -0,0 +1,44 @@
+"""
+_schemas.py — Singularity Prime shared record shapes
+
+TypedDicts for the JSON records the agents read and write. They are plain
+dicts at runtime, so _jsonio (orjson or stdlib json) serialises them with no
+conversion step; the types only document and check the field names.
+
+  State        singularity/_STATE/state.json
+  HistoryEntry one line of singularity/_STATE/history.jsonl
+  TechEntry    one item of tech_registry.json "technologies"
+  Event        the mesh_hook webhook payload
+"""
+
+from typing import TypedDict
+
+
+class State(TypedDict, total=False):
+    schema_version: str
+    current: str
+    next: str
+    version: str
+    updated_at: str
+    updated_by: str
+
+
+# "from" is a keyword, so this shape needs the functional form.
+HistoryEntry = TypedDict("HistoryEntry", {"from": str, "to": str, "timestamp": str})
+
+
+class TechEntry(TypedDict):
+    name: str
+    category: str
+    detected_via: str
+    file_count: int
+
+
+class Event(TypedDict):
+    event: str
+    repository: str
+    org: str
+    current_state: str | None
+    next_state: str
+    validation_matrix: dict[str, bool]
+    timestamp: str
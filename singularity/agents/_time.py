@@ -0,0 +1,17 @@
+"""
+_time.py — Singularity Prime shared timestamp helper
+
+utcnow_iso_z() returns the current UTC time as ISO 8601 with a "Z" suffix
+(e.g. 2026-02-21T09:43:38.309751Z), the format used across the state,
+history and evolution registries.
+"""
+
+import datetime
+
+_UTC = datetime.timezone.utc
+_ISO_Z = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+
+def utcnow_iso_z() -> str:
+    # strftime emits the "Z" directly, skipping isoformat() + replace().
+    return datetime.datetime.now(_UTC).strftime(_ISO_Z)
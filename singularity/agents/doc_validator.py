@@ -17,8 +17,11 @@ Exit code 1 = documentation invalid (CI fails).
 
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from _jsonio import loads
+
 
 REQUIRED_DOCS = [
     ("README.md", None),
@@ -30,43 +33,52 @@ REQUIRED_DOCS = [
 ]
 
 
-def validate() -> list[str]:
-    errors = []
+def check_doc(path_str: str, required_key: str | None) -> str | None:
+    """Validate a single documentation file, return an error message or None."""
+    path = Path(path_str)
 
-    for path_str, required_key in REQUIRED_DOCS:
-        path = Path(path_str)
+    # One stat answers both "exists?" and "empty?"; Markdown needs nothing more.
+    try:
+        size = path.stat().st_size
+    except FileNotFoundError:
+        return f"Missing required documentation file: {path_str}"
+    if size == 0:
+        return f"Documentation file is empty: {path_str}"
+    if not path_str.endswith(".json"):
+        return None
 
-        if not path.exists():
-            errors.append(f"Missing required documentation file: {path_str}")
-            continue
+    # Parse straight from bytes: no str decode, and isspace() stops at the
+    # first non-whitespace byte instead of copying the file like strip().
+    content = path.read_bytes()
+    if content.isspace():
+        return f"Documentation file is empty: {path_str}"
 
-        content = path.read_text(encoding="utf-8").strip()
-        if not content:
-            errors.append(f"Documentation file is empty: {path_str}")
-            continue
+    try:
+        data = loads(content)
+    except json.JSONDecodeError as exc:
+        return f"Invalid JSON in {path_str}: {exc}"
 
-        if path_str.endswith(".json"):
-            try:
-                data = json.loads(content)
-            except json.JSONDecodeError as exc:
-                errors.append(f"Invalid JSON in {path_str}: {exc}")
-                continue
+    if required_key and required_key not in data:
+        return f"{path_str} is missing required top-level key: '{required_key}'"
+    return None
 
-            if required_key and required_key not in data:
-                errors.append(
-                    f"{path_str} is missing required top-level key: '{required_key}'"
-                )
 
-    return errors
+def validate() -> list[str]:
+    with ThreadPoolExecutor(max_workers=len(REQUIRED_DOCS)) as pool:
+        results = pool.map(lambda doc: check_doc(*doc), REQUIRED_DOCS)
+    return [err for err in results if err]
 
 
 def main() -> None:
     errors = validate()
 
     if errors:
-        print("[doc_validator] DOCUMENTATION VALIDATION FAILED:", file=sys.stderr)
-        for err in errors:
-            print(f"  ✗ {err}", file=sys.stderr)
+        # stderr is line-buffered: emit the report as a single write.
+        lines = [
+            "[doc_validator] DOCUMENTATION VALIDATION FAILED:",
+            *(f"  ✗ {err}" for err in errors),
+        ]
+        print("\n".join(lines), file=sys.stderr)
         sys.exit(1)
 
     print("[doc_validator] All documentation checks passed ✓")
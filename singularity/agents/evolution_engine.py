@@ -6,38 +6,113 @@ Orchestrates the full document-evolution lifecycle:
   2. Validate state (delegates to state_machine.py).
   3. Validate documentation (delegates to doc_validator.py).
   4. Update validation_report.json with current check results.
-  5. Update memory_registry.json with this run.
+  5. Append this run to memory_registry.ndjson.
   6. Optionally push state forward if all checks pass.
 
 Idempotent: safe to re-run at any time.
 """
 
-import datetime
+import contextlib
+import io
 import json
-import subprocess
 import sys
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-VALIDATION_REPORT = "singularity/evolution/validation_report.json"
-MEMORY_REGISTRY = "singularity/evolution/memory_registry.json"
-
+import doc_validator
+import pat_validator
+import state_machine
+import tech_detector
+from _jsonio import dumps, loads, write_atomic
+from _time import utcnow_iso_z
 
-def run_check(name: str, command: list[str]) -> bool:
-    """Run a sub-agent check, return True on success."""
-    result = subprocess.run(command, capture_output=True, text=True)
-    if result.returncode == 0:
+VALIDATION_REPORT = "singularity/evolution/validation_report.json"
+MEMORY_REGISTRY = "singularity/evolution/memory_registry.ndjson"
+MEMORY_REGISTRY_META = "singularity/evolution/memory_registry_meta.json"
+LEGACY_MEMORY_REGISTRY = "singularity/evolution/memory_registry.json"
+
+
+# Sub-agents run in-process: they live in this directory, so importing them and
+# calling main() avoids paying interpreter startup once per check.
+CHECKS: dict[str, tuple[str, Callable[[], None]]] = {
+    "state_machine": ("State Machine", state_machine.main),
+    "pat": ("PAT Validator", pat_validator.main),
+    "docs": ("Doc Validator", doc_validator.main),
+    "tech_detector": ("Tech Detector", tech_detector.main),
+}
+
+
+class _ThreadLocalStream(io.TextIOBase):
+    """Stream proxy that sends writes to a per-thread buffer while capturing."""
+
+    def __init__(self, fallback) -> None:
+        self._fallback = fallback
+        self._local = threading.local()
+
+    def write(self, text: str) -> int:
+        return getattr(self._local, "buffer", self._fallback).write(text)
+
+    def flush(self) -> None:
+        getattr(self._local, "buffer", self._fallback).flush()
+
+    @contextlib.contextmanager
+    def capture(self, buffer: io.StringIO) -> Iterator[None]:
+        self._local.buffer = buffer
+        try:
+            yield
+        finally:
+            del self._local.buffer
+
+
+def run_check(
+    entrypoint: Callable[[], None], stdout: _ThreadLocalStream, stderr: _ThreadLocalStream
+) -> tuple[bool, str, str]:
+    """Run a sub-agent's main(), return (passed, stdout, stderr)."""
+    out, err = io.StringIO(), io.StringIO()
+    with stdout.capture(out), stderr.capture(err):
+        try:
+            entrypoint()
+            passed = True
+        except SystemExit as exc:
+            passed = exc.code in (None, 0)
+        except Exception as exc:  # noqa: BLE001 — a crashing check is a failed check
+            print(f"Unhandled {type(exc).__name__}: {exc}", file=sys.stderr)
+            passed = False
+    return passed, out.getvalue(), err.getvalue()
+
+
+def report_check(name: str, passed: bool, stdout: str, stderr: str) -> bool:
+    """Print the outcome of a finished check, return True on success."""
+    if passed:
         print(f"[evolution_engine] ✓ {name}")
         return True
     print(f"[evolution_engine] ✗ {name}")
-    if result.stdout:
-        print(result.stdout)
-    if result.stderr:
-        print(result.stderr, file=sys.stderr)
+    if stdout:
+        print(stdout)
+    if stderr:
+        print(stderr, file=sys.stderr)
     return False
 
 
+def run_checks() -> dict[str, bool]:
+    """Run all checks concurrently; report them in declaration order."""
+    stdout, stderr = _ThreadLocalStream(sys.stdout), _ThreadLocalStream(sys.stderr)
+    with (
+        contextlib.redirect_stdout(stdout),
+        contextlib.redirect_stderr(stderr),
+        ThreadPoolExecutor(max_workers=len(CHECKS)) as pool,
+    ):
+        futures = {
+            key: pool.submit(run_check, entrypoint, stdout, stderr)
+            for key, (_, entrypoint) in CHECKS.items()
+        }
+    return {key: report_check(CHECKS[key][0], *futures[key].result()) for key in CHECKS}
+
+
 def update_validation_report(results: dict[str, bool]) -> None:
-    now = datetime.datetime.now(datetime.timezone.utc).isoformat().replace("+00:00", "Z")
+    now = utcnow_iso_z()
     report = {
         "schema_version": "1.0.0",
         "generated_at": now,
@@ -51,47 +126,49 @@ def update_validation_report(results: dict[str, bool]) -> None:
         },
         "overall": "pass" if all(results.values()) else "fail",
     }
-    Path(VALIDATION_REPORT).write_text(json.dumps(report, indent=2), encoding="utf-8")
+    write_atomic(VALIDATION_REPORT, dumps(report, indent=True))
     print(f"[evolution_engine] Validation report updated: {VALIDATION_REPORT}")
 
 
+def _legacy_memory_entries() -> list[dict]:
+    try:
+        return loads(Path(LEGACY_MEMORY_REGISTRY).read_bytes()).get("entries", [])
+    except (FileNotFoundError, json.JSONDecodeError):
+        return []
+
+
 def update_memory_registry(results: dict[str, bool]) -> None:
-    registry_path = Path(MEMORY_REGISTRY)
+    """Append this run to the NDJSON memory log and refresh its metadata."""
+    now = utcnow_iso_z()
+    entry = {
+        "event": "evolution_engine_run",
+        "timestamp": now,
+        "overall": "pass" if all(results.values()) else "fail",
+        "checks": {k: ("pass" if v else "fail") for k, v in results.items()},
+    }
+    # One line per entry: appending never reads or re-serialises the history.
+    with open(MEMORY_REGISTRY, "ab") as fh:
+        # A new log starts with any entries from the old memory_registry.json.
+        seeded = _legacy_memory_entries() if fh.tell() == 0 else None
+        if seeded is not None:
+            fh.writelines(dumps(e) + b"\n" for e in seeded)
+        fh.write(dumps(entry) + b"\n")
+
+    meta_path = Path(MEMORY_REGISTRY_META)
     try:
-        registry = json.loads(registry_path.read_text(encoding="utf-8"))
+        meta = loads(meta_path.read_bytes())
     except (FileNotFoundError, json.JSONDecodeError):
-        registry = {"schema_version": "1.0.0", "updated_at": "", "entries": []}
-
-    registry["entries"].append(
-        {
-            "event": "evolution_engine_run",
-            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat().replace("+00:00", "Z"),
-            "overall": "pass" if all(results.values()) else "fail",
-            "checks": {k: ("pass" if v else "fail") for k, v in results.items()},
-        }
-    )
-    registry["updated_at"] = datetime.datetime.now(datetime.timezone.utc).isoformat().replace("+00:00", "Z")
-    registry_path.write_text(json.dumps(registry, indent=2), encoding="utf-8")
+        meta = {"schema_version": "1.0.0", "count": 0}
+    meta["updated_at"] = now
+    meta["count"] = (len(seeded) if seeded is not None else meta.get("count", 0)) + 1
+    write_atomic(meta_path, dumps(meta, indent=True))
     print(f"[evolution_engine] Memory registry updated: {MEMORY_REGISTRY}")
 
 
 def main() -> None:
     print("[evolution_engine] Starting Singularity Prime Evolution Engine...")
 
-    checks = {
-        "state_machine": run_check(
-            "State Machine", ["python", "singularity/agents/state_machine.py"]
-        ),
-        "pat": run_check(
-            "PAT Validator", ["python", "singularity/agents/pat_validator.py"]
-        ),
-        "docs": run_check(
-            "Doc Validator", ["python", "singularity/agents/doc_validator.py"]
-        ),
-        "tech_detector": run_check(
-            "Tech Detector", ["python", "singularity/agents/tech_detector.py"]
-        ),
-    }
+    checks = run_checks()
 
     update_validation_report(checks)
     update_memory_registry(checks)
@@ -16,64 +16,80 @@ Idempotent: finding an existing project entry does not create a duplicate.
 import json
 import os
 import sys
+import time
 from pathlib import Path
 
-try:
-    import urllib.request
-    import urllib.error
-except ImportError:
-    pass
+import requests
+
+from _http import RETRY_STATUSES, pooled_session
+from _jsonio import dig, dumps, loads
+from _schemas import State
 
 GH_API = "https://api.github.com/graphql"
 STATE_FILE = "singularity/_STATE/state.json"
 
+# Shared keep-alive session so consecutive GraphQL calls reuse one TLS connection.
+# requests sends "Accept-Encoding: gzip, deflate" by default and decodes the
+# body transparently, so GraphQL responses arrive compressed.
+# The session never retries POST; see _post_gql.
+_SESSION = pooled_session(pool_maxsize=8, retries=3)
+
+
+def _post_gql(body: bytes, headers: dict, query: str) -> requests.Response:
+    """POST a GraphQL request, retrying read-only queries on a 502/503/504.
+
+    Mutations are sent once: repeating one after a gateway error could apply
+    it twice.
+    """
+    attempts = 1 if query.lstrip().startswith("mutation") else 3
+    for attempt in range(attempts):
+        resp = _SESSION.post(GH_API, data=body, headers=headers, timeout=30)
+        if resp.status_code not in RETRY_STATUSES or attempt == attempts - 1:
+            return resp
+        time.sleep(0.3 * 2**attempt)
+
 
 def _gql(token: str, query: str, variables: dict) -> dict:
     """Execute a GitHub GraphQL query."""
-    payload = json.dumps({"query": query, "variables": variables}).encode()
-    req = urllib.request.Request(
-        GH_API,
-        data=payload,
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-        },
-        method="POST",
+    resp = _post_gql(
+        dumps({"query": query, "variables": variables}),
+        {"Authorization": f"Bearer {token}", "Content-Type": "application/json"},
+        query,
     )
-    try:
-        with urllib.request.urlopen(req, timeout=30) as resp:  # noqa: S310
-            return json.loads(resp.read())
-    except urllib.error.HTTPError as exc:
-        body = exc.read().decode("utf-8", errors="replace")
-        print(f"[github_sync] GraphQL HTTP error {exc.code}: {body}", file=sys.stderr)
+    if not resp.ok:
+        print(f"[github_sync] GraphQL HTTP error {resp.status_code}: {resp.text}", file=sys.stderr)
         sys.exit(1)
+    return loads(resp.content)
 
 
-def get_state() -> dict:
+def get_state() -> State:
     try:
-        return json.loads(Path(STATE_FILE).read_text(encoding="utf-8"))
+        return loads(Path(STATE_FILE).read_bytes())
     except (FileNotFoundError, json.JSONDecodeError) as exc:
         print(f"[github_sync] Cannot read state file: {exc}", file=sys.stderr)
         sys.exit(1)
 
 
-def post_issue_comment(token: str, org: str, repo: str, state: dict) -> None:
+def post_issue_comment(token: str, org: str, repo: str, state: State) -> None:
     """Post a state-sync comment to the latest open issue, if any."""
+    # The issue node ID comes back with the number, so the comment needs
+    # only one more round trip.
     query = """
     query($owner: String!, $name: String!) {
       repository(owner: $owner, name: $name) {
         issues(first: 1, states: OPEN, orderBy: {field: UPDATED_AT, direction: DESC}) {
-          nodes { number }
+          nodes { id number }
         }
       }
     }
     """
     result = _gql(token, query, {"owner": org, "name": repo})
-    nodes = result.get("data", {}).get("repository", {}).get("issues", {}).get("nodes", [])
+    nodes = dig(result, "data", "repository", "issues", "nodes", default=[])
     if not nodes:
         print("[github_sync] No open issues found; skipping comment.")
         return
 
+    node_id = nodes[0]["id"]
     issue_number = nodes[0]["number"]
     body = (
         f"**Singularity Prime — State Sync**\n\n"
@@ -89,25 +105,6 @@ def post_issue_comment(token: str, org: str, repo: str, state: dict) -> None:
       }
     }
     """
-    # Get the issue node id
-    id_query = """
-    query($owner: String!, $name: String!, $num: Int!) {
-      repository(owner: $owner, name: $name) {
-        issue(number: $num) { id }
-      }
-    }
-    """
-    id_result = _gql(token, id_query, {"owner": org, "name": repo, "num": issue_number})
-    node_id = (
-        id_result.get("data", {})
-        .get("repository", {})
-        .get("issue", {})
-        .get("id")
-    )
-    if not node_id:
-        print("[github_sync] Could not retrieve issue node ID; skipping comment.")
-        return
-
     _gql(token, mutation, {"id": node_id, "body": body})
     print(f"[github_sync] State comment posted to issue #{issue_number}")
 
@@ -13,36 +13,77 @@ All operations gracefully degrade if credentials are not set — CI will not fai
 due to missing Google credentials; a warning is emitted instead.
 """
 
+import functools
 import json
 import os
 import sys
-import datetime
-import urllib.request
-import urllib.error
-import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import requests
+
+from _http import pooled_session
+from _time import utcnow_iso_z
+
+# Shared keep-alive session: repeated calls to the same googleapis.com host
+# (and the OAuth token endpoint) reuse one TLS connection.
+_SESSION = pooled_session(pool_maxsize=4)
+
+
+SCOPES = [
+    "https://www.googleapis.com/auth/gmail.send",
+    "https://www.googleapis.com/auth/drive.file",
+    "https://www.googleapis.com/auth/spreadsheets",
+]
+
+
+@functools.lru_cache(maxsize=1)
+def _service_account_credentials():
+    """Parse GOOGLE_SERVICE_ACCOUNT_JSON once and build google-auth credentials."""
+    sa_json = os.environ.get("GOOGLE_SERVICE_ACCOUNT_JSON")
+    if not sa_json:
+        return None
+    try:
+        sa = json.loads(sa_json)
+    except json.JSONDecodeError:
+        print("[google_workspace] Invalid GOOGLE_SERVICE_ACCOUNT_JSON", file=sys.stderr)
+        return None
+    try:
+        from google.oauth2 import service_account
+    except ImportError:
+        # google-auth is an optional dependency.
+        print(
+            "[google_workspace] Service account JSON detected. "
+            "Install 'google-auth' package to activate token exchange.",
+            file=sys.stderr,
+        )
+        return None
+    try:
+        return service_account.Credentials.from_service_account_info(sa, scopes=SCOPES)
+    except ValueError as exc:
+        print(f"[google_workspace] Invalid service account: {exc}", file=sys.stderr)
+        return None
+
 
 def _get_token() -> str | None:
     """Return a bearer token from environment or service account."""
     direct = os.environ.get("GOOGLE_OAUTH_TOKEN")
     if direct:
         return direct
-    sa_json = os.environ.get("GOOGLE_SERVICE_ACCOUNT_JSON")
-    if sa_json:
+    creds = _service_account_credentials()
+    if creds is None:
+        return None
+    # The JWT → access-token exchange only happens on first use or expiry.
+    if not creds.valid:
+        from google.auth.exceptions import RefreshError
+        from google.auth.transport.requests import Request
+
         try:
-            sa = json.loads(sa_json)
-            _ = sa.get("client_email")  # validate structure
-            # In production, use google-auth to exchange SA creds for an access token.
-            # Returning None here as google-auth is an optional dependency.
-            print(
-                "[google_workspace] Service account JSON detected. "
-                "Install 'google-auth' package to activate token exchange.",
-                file=sys.stderr,
-            )
-        except json.JSONDecodeError:
-            print("[google_workspace] Invalid GOOGLE_SERVICE_ACCOUNT_JSON", file=sys.stderr)
-    return None
+            creds.refresh(Request(session=_SESSION))
+        except RefreshError as exc:
+            print(f"[google_workspace] Token exchange failed: {exc}", file=sys.stderr)
+            return None
+    return creds.token
 
 
 def send_gmail_notification(subject: str, body: str, recipient: str) -> bool:
@@ -58,20 +99,68 @@ def send_gmail_notification(subject: str, body: str, recipient: str) -> bool:
     import base64
     raw_message = f"To: {recipient}\nSubject: {subject}\n\n{body}"
     encoded = base64.urlsafe_b64encode(raw_message.encode()).decode()
-    payload = json.dumps({"raw": encoded}).encode()
-    req = urllib.request.Request(
+    resp = _SESSION.post(
         "https://gmail.googleapis.com/gmail/v1/users/me/messages/send",
-        data=payload,
-        headers={"Authorization": f"Bearer {token}", "Content-Type": "application/json"},
-        method="POST",
+        json={"raw": encoded},
+        headers={"Authorization": f"Bearer {token}"},
+        timeout=30,
     )
-    try:
-        with urllib.request.urlopen(req, timeout=30) as resp:  # noqa: S310
-            print(f"[google_workspace] Gmail sent to {recipient}: {resp.status}")
-            return True
-    except urllib.error.HTTPError as exc:
-        print(f"[google_workspace] Gmail error {exc.code}", file=sys.stderr)
+    if not resp.ok:
+        print(f"[google_workspace] Gmail error {resp.status_code}", file=sys.stderr)
         return False
+    print(f"[google_workspace] Gmail sent to {recipient}: {resp.status_code}")
+    return True
+
+
+DRIVE_UPLOAD_URL = "https://www.googleapis.com/upload/drive/v3/files"
+# Files above this size use a resumable upload streamed from disk instead of
+# being held in memory as part of a multipart body.
+RESUMABLE_THRESHOLD = 5 * 1024 * 1024
+
+# multipart/related delimiters, encoded once.
+_BOUNDARY = "singularity_boundary"
+_BOUND_START = f"--{_BOUNDARY}\r\nContent-Type: application/json\r\n\r\n".encode()
+_BOUND_MID = f"\r\n--{_BOUNDARY}\r\nContent-Type: application/json\r\n\r\n".encode()
+_BOUND_END = f"\r\n--{_BOUNDARY}--".encode()
+
+
+def _drive_upload_multipart(token: str, path: Path, metadata: dict) -> requests.Response:
+    # A single join allocates the body once at its final size.
+    body = b"".join(
+        [_BOUND_START, json.dumps(metadata).encode(), _BOUND_MID, path.read_bytes(), _BOUND_END]
+    )
+    return _SESSION.post(
+        f"{DRIVE_UPLOAD_URL}?uploadType=multipart",
+        data=body,
+        headers={
+            "Authorization": f"Bearer {token}",
+            "Content-Type": f"multipart/related; boundary={_BOUNDARY}",
+        },
+        timeout=60,
+    )
+
+
+def _drive_upload_resumable(token: str, path: Path, metadata: dict) -> requests.Response:
+    session = _SESSION.post(
+        f"{DRIVE_UPLOAD_URL}?uploadType=resumable",
+        json=metadata,
+        headers={
+            "Authorization": f"Bearer {token}",
+            "X-Upload-Content-Type": "application/octet-stream",
+            "X-Upload-Content-Length": str(path.stat().st_size),
+        },
+        timeout=30,
+    )
+    if not session.ok:
+        return session
+    # requests streams file objects in chunks, so peak memory stays O(chunk).
+    with path.open("rb") as fh:
+        return _SESSION.put(
+            session.headers["Location"],
+            data=fh,
+            headers={"Content-Type": "application/octet-stream"},
+            timeout=300,
+        )
 
 
 def archive_to_drive(file_path: str, folder_id: str | None = None) -> bool:
@@ -84,36 +173,17 @@ def archive_to_drive(file_path: str, folder_id: str | None = None) -> bool:
         )
         return False
 
-    content = Path(file_path).read_bytes()
-    name = Path(file_path).name
-    metadata = json.dumps(
-        {"name": name, **({"parents": [folder_id]} if folder_id else {})}
-    ).encode()
-    boundary = "singularity_boundary"
-    body = (
-        f"--{boundary}\r\nContent-Type: application/json\r\n\r\n".encode()
-        + metadata
-        + f"\r\n--{boundary}\r\nContent-Type: application/json\r\n\r\n".encode()
-        + content
-        + f"\r\n--{boundary}--".encode()
-    )
-    req = urllib.request.Request(
-        "https://www.googleapis.com/upload/drive/v3/files?uploadType=multipart",
-        data=body,
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Content-Type": f"multipart/related; boundary={boundary}",
-        },
-        method="POST",
-    )
-    try:
-        with urllib.request.urlopen(req, timeout=60) as resp:  # noqa: S310
-            result = json.loads(resp.read())
-            print(f"[google_workspace] Drive upload OK: {result.get('id')}")
-            return True
-    except urllib.error.HTTPError as exc:
-        print(f"[google_workspace] Drive error {exc.code}", file=sys.stderr)
+    path = Path(file_path)
+    metadata = {"name": path.name, **({"parents": [folder_id]} if folder_id else {})}
+    if path.stat().st_size > RESUMABLE_THRESHOLD:
+        resp = _drive_upload_resumable(token, path, metadata)
+    else:
+        resp = _drive_upload_multipart(token, path, metadata)
+    if not resp.ok:
+        print(f"[google_workspace] Drive error {resp.status_code}", file=sys.stderr)
         return False
+    print(f"[google_workspace] Drive upload OK: {resp.json().get('id')}")
+    return True
 
 
 def log_to_sheets(spreadsheet_id: str, row: list) -> bool:
@@ -130,20 +200,17 @@ def log_to_sheets(spreadsheet_id: str, row: list) -> bool:
         f"https://sheets.googleapis.com/v4/spreadsheets/{spreadsheet_id}"
         f"/values/A1:append?valueInputOption=USER_ENTERED"
     )
-    payload = json.dumps({"values": [row]}).encode()
-    req = urllib.request.Request(
+    resp = _SESSION.post(
         url,
-        data=payload,
-        headers={"Authorization": f"Bearer {token}", "Content-Type": "application/json"},
-        method="POST",
+        json={"values": [row]},
+        headers={"Authorization": f"Bearer {token}"},
+        timeout=30,
     )
-    try:
-        with urllib.request.urlopen(req, timeout=30) as resp:  # noqa: S310
-            print(f"[google_workspace] Sheets row appended: {resp.status}")
-            return True
-    except urllib.error.HTTPError as exc:
-        print(f"[google_workspace] Sheets error {exc.code}", file=sys.stderr)
+    if not resp.ok:
+        print(f"[google_workspace] Sheets error {resp.status_code}", file=sys.stderr)
         return False
+    print(f"[google_workspace] Sheets row appended: {resp.status_code}")
+    return True
 
 
 def main() -> None:
@@ -151,28 +218,41 @@ def main() -> None:
     recipient = os.environ.get("NOTIFY_EMAIL", "")
     spreadsheet_id = os.environ.get("GOOGLE_SHEET_ID", "")
 
-    now = datetime.datetime.now(datetime.timezone.utc).isoformat().replace("+00:00", "Z")
+    now = utcnow_iso_z()
 
-    if event == "deployment" and recipient:
-        send_gmail_notification(
-            subject="[Singularity Prime] Deployment Complete",
-            body=f"Repository deployed successfully at {now}.",
-            recipient=recipient,
-        )
-    elif event == "approval_required" and recipient:
-        send_gmail_notification(
-            subject="[Singularity Prime] Approval Required",
-            body=f"A PR is awaiting your approval. Timestamp: {now}.",
-            recipient=recipient,
-        )
+    _get_token()  # resolve credentials once before fanning out
 
-    validation_report = "singularity/evolution/validation_report.json"
-    drive_folder = os.environ.get("GOOGLE_DRIVE_FOLDER_ID")
-    if Path(validation_report).exists():
-        archive_to_drive(validation_report, drive_folder)
+    # Gmail, Drive and Sheets are independent, so they run concurrently on
+    # the shared session and the run takes as long as the slowest call.
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        futures = []
+        if event == "deployment" and recipient:
+            futures.append(pool.submit(
+                send_gmail_notification,
+                subject="[Singularity Prime] Deployment Complete",
+                body=f"Repository deployed successfully at {now}.",
+                recipient=recipient,
+            ))
+        elif event == "approval_required" and recipient:
+            futures.append(pool.submit(
+                send_gmail_notification,
+                subject="[Singularity Prime] Approval Required",
+                body=f"A PR is awaiting your approval. Timestamp: {now}.",
+                recipient=recipient,
+            ))
+
+        validation_report = "singularity/evolution/validation_report.json"
+        drive_folder = os.environ.get("GOOGLE_DRIVE_FOLDER_ID")
+        if Path(validation_report).exists():
+            futures.append(pool.submit(archive_to_drive, validation_report, drive_folder))
+
+        if spreadsheet_id:
+            futures.append(
+                pool.submit(log_to_sheets, spreadsheet_id, [now, event, "Singularity Prime"])
+            )
 
-    if spreadsheet_id:
-        log_to_sheets(spreadsheet_id, [now, event, "Singularity Prime"])
+        for future in futures:
+            future.result()
 
     print("[google_workspace] Google Workspace connector run complete.")
 
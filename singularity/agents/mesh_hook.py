@@ -16,6 +16,7 @@ Event schema:
 Environment variables:
   MESH_HOOK_URL     — Webhook URL of the Sovereign Mesh Node
   MESH_HOOK_SECRET  — Optional HMAC-SHA256 shared secret for request signing
+  MESH_HOOK_FORMAT  — "json" (default) or "msgpack" (requires msgspec)
   ORG               — GitHub organisation
   REPO              — Repository name
 
@@ -27,19 +28,33 @@ import hmac
 import json
 import os
 import sys
-import datetime
-import urllib.request
-import urllib.error
+from functools import lru_cache
 from pathlib import Path
 
+import requests
+
+try:
+    import msgspec
+except ImportError:  # only needed for MESH_HOOK_FORMAT=msgpack
+    msgspec = None
+
+from _http import pooled_session
+from _jsonio import dumps, load_json_cached, loads
+from _schemas import Event, State
+from _time import utcnow_iso_z
+
 
 STATE_FILE = "singularity/_STATE/state.json"
 VALIDATION_REPORT = "singularity/evolution/validation_report.json"
+_PASS = "pass"
 
+# Keep-alive session so repeated events to the mesh node reuse one connection.
+_SESSION = pooled_session(retries=2, backoff_factor=0.2)
 
-def _build_event(state: dict, validation: dict) -> dict:
+
+def _build_event(state: State, validation: dict) -> Event:
     checks = validation.get("checks", {})
-    matrix = {k: v.get("status") == "pass" for k, v in checks.items()}
+    matrix = {k: v.get("status") == _PASS for k, v in checks.items()}
     return {
         "event": "STATE_TRANSITION",
         "repository": os.environ.get("REPO", "unknown"),
@@ -47,51 +62,65 @@ def _build_event(state: dict, validation: dict) -> dict:
         "current_state": state.get("current"),
         "next_state": state.get("next", ""),
         "validation_matrix": matrix,
-        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat().replace("+00:00", "Z"),
+        "timestamp": utcnow_iso_z(),
     }
 
 
+@lru_cache(maxsize=4)
+def _primed(secret: bytes) -> "hmac.HMAC":
+    # Keyed HMAC state with nothing hashed yet; copies skip the key schedule.
+    return hmac.new(secret, b"", hashlib.sha256)
+
+
 def _sign(payload: bytes, secret: str) -> str:
-    return "sha256=" + hmac.new(
-        secret.encode(), payload, hashlib.sha256
-    ).hexdigest()
+    mac = _primed(secret.encode()).copy()
+    mac.update(payload)
+    return "sha256=" + mac.hexdigest()
+
+
+def _encode(event: Event) -> tuple[bytes, str]:
+    """Serialise the event as compact JSON, or MessagePack when MESH_HOOK_FORMAT=msgpack."""
+    if os.environ.get("MESH_HOOK_FORMAT", "json").lower() == "msgpack":
+        if msgspec is not None:
+            return msgspec.msgpack.encode(event), "application/msgpack"
+        print("[mesh_hook] WARNING: msgspec not installed; sending JSON instead.", file=sys.stderr)
+    return dumps(event), "application/json"
 
 
-def send_event(event: dict) -> bool:
+def send_event(event: Event) -> bool:
     url = os.environ.get("MESH_HOOK_URL")
     if not url:
         print("[mesh_hook] WARNING: MESH_HOOK_URL not set. Skipping mesh event.")
         return False
 
-    payload = json.dumps(event, indent=2).encode()
-    headers = {"Content-Type": "application/json"}
+    payload, content_type = _encode(event)
+    headers = {"Content-Type": content_type}
 
     secret = os.environ.get("MESH_HOOK_SECRET")
     if secret:
         headers["X-Hub-Signature-256"] = _sign(payload, secret)
 
-    req = urllib.request.Request(url, data=payload, headers=headers, method="POST")
     try:
-        with urllib.request.urlopen(req, timeout=30) as resp:  # noqa: S310
-            print(f"[mesh_hook] Event sent: HTTP {resp.status}")
-            return True
-    except urllib.error.HTTPError as exc:
-        print(f"[mesh_hook] HTTP error {exc.code}", file=sys.stderr)
-        return False
-    except OSError as exc:
+        resp = _SESSION.post(url, data=payload, headers=headers, timeout=30)
+    except requests.RequestException as exc:
         print(f"[mesh_hook] Connection error: {exc}", file=sys.stderr)
         return False
+    if not resp.ok:
+        print(f"[mesh_hook] HTTP error {resp.status_code}", file=sys.stderr)
+        return False
+    print(f"[mesh_hook] Event sent: HTTP {resp.status_code}")
+    return True
 
 
 def main() -> None:
     try:
-        state = json.loads(Path(STATE_FILE).read_text(encoding="utf-8"))
+        state = load_json_cached(STATE_FILE)
     except (FileNotFoundError, json.JSONDecodeError) as exc:
         print(f"[mesh_hook] Cannot read state: {exc}", file=sys.stderr)
         sys.exit(1)
 
     try:
-        validation = json.loads(Path(VALIDATION_REPORT).read_text(encoding="utf-8"))
+        validation = loads(Path(VALIDATION_REPORT).read_bytes())
     except (FileNotFoundError, json.JSONDecodeError):
         validation = {}
 
@@ -16,9 +16,13 @@ Exit code 1 = PAT violation (CI fails).
 
 import json
 import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from _jsonio import load_json_cached
+
 REQUIRED_FILES = [
     "singularity/_STATE/state.json",
     "singularity/evolution/checklist.json",
@@ -27,17 +31,39 @@ REQUIRED_FILES = [
     ".github/CODEOWNERS",
 ]
 
+# Files larger than this are skipped by the secret scan (generated artefacts,
+# lockfiles); hand-written config stays far below it.
+MAX_SCAN_BYTES = 4 * 1024 * 1024
+
 FORBIDDEN_PATTERNS = [
-    "password=",
-    "secret=",
-    "api_key=",
-    "private_key",
-    "-----BEGIN RSA",
-    "-----BEGIN EC",
-    "ghp_",
-    "github_pat_",
+    b"password=",
+    b"secret=",
+    b"api_key=",
+    b"private_key",
+    b"-----BEGIN RSA",
+    b"-----BEGIN EC",
+    b"ghp_",
+    b"github_pat_",
 ]
 
+# Match patterns that look like actual assignments: key=value or key: value
+# This avoids false positives from files that merely reference these strings
+# (e.g. this validator file itself, documentation, or config schema files).
+# Built and compiled once at import so repeated scans reuse it. It runs on
+# decoded text, so Unicode \s and case folding behave as they always have.
+_FORBIDDEN_ALT = b"|".join(re.escape(p.rstrip(b"=").rstrip()) for p in FORBIDDEN_PATTERNS)
+_SECRET_RE = re.compile(
+    r'(?:^|[;\n])\s*["\']?(?:'
+    + _FORBIDDEN_ALT.decode()
+    + r')["\']?\s*[:=]\s*[^\s{}\[\]#\'"]{4,}',
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# Every regex match contains one of these literals (case-insensitively). For an
+# ASCII file that is exactly a substring test on its lowercased bytes, so files
+# without any of them skip the decode and the regex.
+_TOKENS = tuple(sorted({p.rstrip(b"=").rstrip().lower() for p in FORBIDDEN_PATTERNS}))
+
 
 def check_required_files() -> list[str]:
     errors = []
@@ -53,7 +79,7 @@ def check_state_json() -> list[str]:
     if not state_path.exists():
         return errors  # Already caught by check_required_files
     try:
-        state = json.loads(state_path.read_text(encoding="utf-8"))
+        state = load_json_cached(state_path)
         for field in ("current", "version", "schema_version"):
             if field not in state:
                 errors.append(f"state.json missing required field: '{field}'")
@@ -62,38 +88,69 @@ def check_state_json() -> list[str]:
     return errors
 
 
+def _scan_file(fpath: str) -> bool | None:
+    """Return True if the file contains a secret-like assignment.
+
+    Returns None when the file was not scanned (over MAX_SCAN_BYTES or
+    unreadable), so the caller can report it instead of counting it clean.
+
+    The file is read once as bytes. ASCII files without any of the _TOKENS
+    substrings are rejected there; everything else is decoded the way
+    Path.read_text(errors="ignore") would (invalid bytes dropped, universal
+    newlines) and searched with the regex.
+    """
+    try:
+        with open(fpath, "rb") as fh:
+            size = os.fstat(fh.fileno()).st_size
+            if size > MAX_SCAN_BYTES:
+                return None
+            if size == 0:
+                return False
+            data = fh.read()
+    except OSError:
+        return None
+    # Non-ASCII bytes are dropped or case-folded differently once decoded, so
+    # only ASCII files take the byte-level shortcut.
+    if data.isascii():
+        lowered = data.lower()
+        if not any(tok in lowered for tok in _TOKENS):
+            return False
+    text = data.decode("utf-8", "ignore").replace("\r\n", "\n").replace("\r", "\n")
+    return _SECRET_RE.search(text) is not None
+
+
 def check_secret_leakage() -> list[str]:
     """Scan tracked files for obvious secret patterns (variable assignments only)."""
-    # Match patterns that look like actual assignments: key=value or key: value
-    # This avoids false positives from files that merely reference these strings
-    # (e.g. this validator file itself, documentation, or config schema files).
-    import re
-    assignment_re = re.compile(
-        r'(?:^|[;\n])\s*["\']?(?:' +
-        '|'.join(re.escape(p.rstrip("=").rstrip()) for p in FORBIDDEN_PATTERNS) +
-        r')["\']?\s*[:=]\s*[^\s{}\[\]#\'"]{4,}',
-        re.IGNORECASE | re.MULTILINE,
-    )
-    errors = []
     # Skip this file itself — it intentionally lists the forbidden patterns
     self_path = os.path.abspath(__file__)
-    for root, dirs, files in os.walk("."):
-        dirs[:] = [d for d in dirs if d not in {".git", "node_modules", "__pycache__", ".venv"}]
-        for fname in files:
-            if not fname.endswith((".json", ".yml", ".yaml", ".env", ".sh", ".ps1")):
-                continue
-            fpath = os.path.join(root, fname)
-            if os.path.abspath(fpath) == self_path:
-                continue
-            try:
-                content = Path(fpath).read_text(encoding="utf-8", errors="ignore")
-            except OSError:
-                continue
-            if assignment_re.search(content):
-                errors.append(
-                    f"Potential secret assignment in {fpath}: review for hardcoded credentials."
-                )
-    return errors
+    # The walk and its pruning stay on this thread; the per-file scans (disk
+    # reads, prefilter and regex) overlap on the pool.
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as pool:
+        scans = []
+        for root, dirs, files in os.walk("."):
+            dirs[:] = [d for d in dirs if d not in {".git", "node_modules", "__pycache__", ".venv"}]
+            for fname in files:
+                if not fname.endswith((".json", ".yml", ".yaml", ".env", ".sh", ".ps1")):
+                    continue
+                fpath = os.path.join(root, fname)
+                if os.path.abspath(fpath) == self_path:
+                    continue
+                scans.append((fpath, pool.submit(_scan_file, fpath)))
+
+    results = [(fpath, scan.result()) for fpath, scan in scans]
+    skipped = [fpath for fpath, hit in results if hit is None]
+    if skipped:
+        lines = [
+            f"[pat_validator] WARNING: {len(skipped)} file(s) not scanned for secrets "
+            f"(larger than {MAX_SCAN_BYTES // (1024 * 1024)} MiB or unreadable):",
+            *(f"  ! {fpath}" for fpath in skipped),
+        ]
+        print("\n".join(lines), file=sys.stderr)
+    return [
+        f"Potential secret assignment in {fpath}: review for hardcoded credentials."
+        for fpath, hit in results
+        if hit
+    ]
 
 
 def main() -> None:
@@ -104,9 +161,12 @@ def main() -> None:
     all_errors.extend(check_secret_leakage())
 
     if all_errors:
-        print("[pat_validator] PAT PROTOCOL VIOLATIONS DETECTED:", file=sys.stderr)
-        for err in all_errors:
-            print(f"  ✗ {err}", file=sys.stderr)
+        # stderr is line-buffered: emit the report as a single write.
+        lines = [
+            "[pat_validator] PAT PROTOCOL VIOLATIONS DETECTED:",
+            *(f"  ✗ {err}" for err in all_errors),
+        ]
+        print("\n".join(lines), file=sys.stderr)
         sys.exit(1)
 
     print("[pat_validator] PAT Protocol: All checks passed ✓")
@@ -2,7 +2,7 @@
 state_machine.py — Singularity Prime State Machine Validator
 
 Reads singularity/_STATE/state.json, validates that the requested transition
-is allowed, and appends to history.json on success.
+is allowed, and appends one line to history.jsonl on success.
 
 Exit code 0 = valid transition.
 Exit code 1 = invalid transition (CI fails).
@@ -10,26 +10,34 @@ Exit code 1 = invalid transition (CI fails).
 
 import json
 import sys
-import datetime
+from pathlib import Path
+
+from _jsonio import dumps, load_json_cached, loads
+from _schemas import HistoryEntry
+from _time import utcnow_iso_z
 
 STATE_FILE = "singularity/_STATE/state.json"
-HISTORY_FILE = "singularity/_STATE/history.json"
+HISTORY_FILE = "singularity/_STATE/history.jsonl"
+LEGACY_HISTORY_FILE = "singularity/_STATE/history.json"
 TRANSITIONS_FILE = "singularity/_STATE/transitions.json"
 
-ALLOWED = {
-    "NEW_IDEA": ["DISCOVERY_RUNNING"],
-    "DISCOVERY_RUNNING": ["EVOLUTION_COMPLETE"],
-    "EVOLUTION_COMPLETE": ["BUILD_RUNNING"],
-    "BUILD_RUNNING": ["VALIDATION"],
-    "VALIDATION": ["APPROVAL"],
-    "APPROVAL": ["RELEASED"],
+ALLOWED: dict[str, frozenset[str]] = {
+    "NEW_IDEA": frozenset({"DISCOVERY_RUNNING"}),
+    "DISCOVERY_RUNNING": frozenset({"EVOLUTION_COMPLETE"}),
+    "EVOLUTION_COMPLETE": frozenset({"BUILD_RUNNING"}),
+    "BUILD_RUNNING": frozenset({"VALIDATION"}),
+    "VALIDATION": frozenset({"APPROVAL"}),
+    "APPROVAL": frozenset({"RELEASED"}),
 }
 
 
-def load_json(path: str) -> dict:
+def load_json(path: str, cached: bool = False) -> dict:
+    """Load a JSON file, exiting on error. Cached results are shared: do not mutate them."""
     try:
-        with open(path, "r", encoding="utf-8") as fh:
-            return json.load(fh)
+        if cached:
+            return load_json_cached(path)
+        with open(path, "rb") as fh:
+            return loads(fh.read())
     except FileNotFoundError:
         print(f"[state_machine] ERROR: Required file not found: {path}", file=sys.stderr)
         sys.exit(1)
@@ -38,13 +46,24 @@ def load_json(path: str) -> dict:
         sys.exit(1)
 
 
-def save_json(path: str, data: dict) -> None:
-    with open(path, "w", encoding="utf-8") as fh:
-        json.dump(data, fh, indent=2)
+def _legacy_transitions() -> list[HistoryEntry]:
+    try:
+        return loads(Path(LEGACY_HISTORY_FILE).read_bytes()).get("transitions", [])
+    except (FileNotFoundError, json.JSONDecodeError):
+        return []
+
+
+def _append_history(entry: HistoryEntry) -> None:
+    """Append one transition to the JSON Lines history; nothing already logged is re-read."""
+    with open(HISTORY_FILE, "ab") as fh:
+        # A new log starts with any transitions from the old history.json.
+        if fh.tell() == 0:
+            fh.writelines(dumps(t) + b"\n" for t in _legacy_transitions())
+        fh.write(dumps(entry) + b"\n")
 
 
 def main() -> None:
-    state = load_json(STATE_FILE)
+    state = load_json(STATE_FILE, cached=True)
 
     current = state.get("current", "")
     next_state = state.get("next", "")
@@ -57,31 +76,24 @@ def main() -> None:
         print(f"[state_machine] INFO: No transition requested (next is empty). Current state: {current}")
         sys.exit(0)
 
-    allowed_next = ALLOWED.get(current, [])
+    allowed_next = ALLOWED.get(current, frozenset())
     if next_state not in allowed_next:
         print(
             f"[state_machine] ERROR: Invalid state transition: {current} → {next_state}. "
-            f"Allowed: {allowed_next}",
+            f"Allowed: {sorted(allowed_next)}",
             file=sys.stderr,
         )
         sys.exit(1)
 
     print(f"[state_machine] OK: Valid transition {current} → {next_state}")
 
-    # Append to history
-    try:
-        history = load_json(HISTORY_FILE)
-    except SystemExit:
-        history = {"schema_version": "1.0.0", "transitions": []}
-
-    history.setdefault("transitions", []).append(
+    _append_history(
         {
             "from": current,
             "to": next_state,
-            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat().replace("+00:00", "Z"),
+            "timestamp": utcnow_iso_z(),
         }
     )
-    save_json(HISTORY_FILE, history)
     print("[state_machine] History updated.")
 
 
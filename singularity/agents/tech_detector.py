@@ -7,11 +7,15 @@ to singularity/evolution/tech_registry.json.
 Idempotent: always overwrites the registry with the current scan result.
 """
 
-import json
-import datetime
+import fnmatch
+import os
 import sys
 from pathlib import Path
 
+from _jsonio import dumps, write_atomic
+from _schemas import TechEntry
+from _time import utcnow_iso_z
+
 REGISTRY_PATH = "singularity/evolution/tech_registry.json"
 
 INDICATORS: list[tuple[str, str, str]] = [
@@ -42,26 +46,90 @@ INDICATORS: list[tuple[str, str, str]] = [
 ]
 
 
-def detect() -> list[dict]:
-    found = []
-    seen: set[str] = set()
-    repo_root = Path(".")
-
-    for pattern, tech_name, category in INDICATORS:
-        matches = list(repo_root.rglob(pattern))
-        # Exclude .git and node_modules
-        matches = [
-            m for m in matches
-            if ".git" not in m.parts and "node_modules" not in m.parts
+EXCLUDED_DIRS = {".git", "node_modules"}
+
+
+def _compile_indicators() -> tuple[dict, dict, list, list]:
+    """Split INDICATORS into lookup tables so each file is classified once.
+
+    Returns (by_ext, by_name, name_globs, path_globs), all holding indices
+    into INDICATORS:
+      by_ext      "*.py"                     → {".py": [i]}
+      by_name     "go.mod"                   → {"go.mod": [i]}
+      name_globs  "Dockerfile*"              → [(i, "Dockerfile*")]
+      path_globs  ".github/workflows/*.yml"  → [(i, (".github", "workflows"), False, "*.yml")]
+                  "terraform/**/*.tf"        → [(i, ("terraform",), True, "*.tf")]
+    """
+    by_ext: dict[str, list[int]] = {}
+    by_name: dict[str, list[int]] = {}
+    name_globs: list[tuple[int, str]] = []
+    path_globs: list[tuple[int, tuple[str, ...], bool, str]] = []
+    for i, (pattern, _, _) in enumerate(INDICATORS):
+        if "/" in pattern:
+            head, name_glob = pattern.rsplit("/", 1)
+            recursive = head.endswith("/**")
+            if recursive:
+                head = head[: -len("/**")]
+            path_globs.append((i, tuple(head.split("/")), recursive, name_glob))
+        elif pattern.startswith("*.") and not any(c in pattern[1:] for c in "*?["):
+            by_ext.setdefault(pattern[1:], []).append(i)
+        elif not any(c in pattern for c in "*?["):
+            by_name.setdefault(pattern, []).append(i)
+        else:
+            name_globs.append((i, pattern))
+    return by_ext, by_name, name_globs, path_globs
+
+
+_BY_EXT, _BY_NAME, _NAME_GLOBS, _PATH_GLOBS = _compile_indicators()
+
+
+def _dir_matches(parts: tuple[str, ...], head: tuple[str, ...], recursive: bool) -> bool:
+    """Match a directory against a pattern head the way rglob does.
+
+    rglob anchors a pattern at any depth, so "a/b/*.x" matches files whose
+    directory ends with a/b, and "a/**/*.x" matches files anywhere below an
+    "a" directory.
+    """
+    n = len(head)
+    if not recursive:
+        return parts[-n:] == head
+    return any(parts[i:i + n] == head for i in range(len(parts) - n + 1))
+
+
+def detect() -> list[TechEntry]:
+    # One pruned walk of the tree instead of one rglob pass per indicator.
+    counts = [0] * len(INDICATORS)
+    for root, dirs, files in os.walk("."):
+        dirs[:] = [d for d in dirs if d not in EXCLUDED_DIRS]
+        parts = Path(root).parts
+        path_globs = [
+            (i, name_glob)
+            for i, head, recursive, name_glob in _PATH_GLOBS
+            if _dir_matches(parts, head, recursive)
         ]
-        if matches and tech_name not in seen:
+        for fname in files:
+            for i in _BY_EXT.get(os.path.splitext(fname)[1], ()):
+                counts[i] += 1
+            for i in _BY_NAME.get(fname, ()):
+                counts[i] += 1
+            for i, name_glob in _NAME_GLOBS:
+                if fnmatch.fnmatch(fname, name_glob):
+                    counts[i] += 1
+            for i, name_glob in path_globs:
+                if fnmatch.fnmatch(fname, name_glob):
+                    counts[i] += 1
+
+    found: list[TechEntry] = []
+    seen: set[str] = set()
+    for (pattern, tech_name, category), count in zip(INDICATORS, counts):
+        if count and tech_name not in seen:
             seen.add(tech_name)
             found.append(
                 {
                     "name": tech_name,
                     "category": category,
                     "detected_via": pattern,
-                    "file_count": len(matches),
+                    "file_count": count,
                 }
             )
 
@@ -72,13 +140,19 @@ def main() -> None:
     technologies = detect()
     registry = {
         "schema_version": "1.0.0",
-        "updated_at": datetime.datetime.now(datetime.timezone.utc).isoformat().replace("+00:00", "Z"),
+        "updated_at": utcnow_iso_z(),
         "technologies": technologies,
     }
-    Path(REGISTRY_PATH).write_text(json.dumps(registry, indent=2), encoding="utf-8")
-    print(f"[tech_detector] Detected {len(technologies)} technologies → {REGISTRY_PATH}")
-    for t in technologies:
-        print(f"  • {t['name']} ({t['category']}) — {t['file_count']} file(s)")
+    write_atomic(REGISTRY_PATH, dumps(registry, indent=True))
+    # One write for the whole summary rather than one per technology.
+    lines = [
+        f"[tech_detector] Detected {len(technologies)} technologies → {REGISTRY_PATH}",
+        *(
+            f"  • {t['name']} ({t['category']}) — {t['file_count']} file(s)"
+            for t in technologies
+        ),
+    ]
+    print("\n".join(lines))
 
 
 if __name__ == "__main__":
@@ -6,6 +6,7 @@ Reads and writes secrets from/to HashiCorp Vault.
 Capabilities:
   - Read secrets at a given KV path.
   - Write release metadata to Vault on deployment.
+  - Write several payloads to one secret in a single request.
   - Gracefully degrades if VAULT_ADDR / VAULT_TOKEN are not set.
 
 Environment variables:
@@ -14,73 +15,109 @@ Environment variables:
   VAULT_KV_PATH — KV path prefix (default: secret/singularity)
 """
 
-import json
 import os
 import sys
-import datetime
-import urllib.request
-import urllib.error
+from functools import lru_cache
 from pathlib import Path
 
+from _http import pooled_session
+from _jsonio import dumps, load_json_cached, loads
+from _time import utcnow_iso_z
 
-def _vault_url() -> str | None:
-    return os.environ.get("VAULT_ADDR")
-
-
-def _vault_token() -> str | None:
-    return os.environ.get("VAULT_TOKEN")
+# Keep-alive session: every read/write goes to the same Vault server.
+_SESSION = pooled_session(retries=2, backoff_factor=0.2)
 
 
 def _kv_path() -> str:
     return os.environ.get("VAULT_KV_PATH", "secret/singularity")
 
 
-def read_secret(secret_name: str) -> dict | None:
-    """Read a KV secret from Vault. Returns the data dict or None."""
-    addr = _vault_url()
-    token = _vault_token()
+@lru_cache(maxsize=1)
+def _client() -> tuple[str, dict] | None:
+    """Return (base URL, default headers), or None when Vault is not configured.
+
+    Address and token do not change during a run, so this is built once.
+    """
+    addr = os.environ.get("VAULT_ADDR")
+    token = os.environ.get("VAULT_TOKEN")
     if not addr or not token:
-        print("[vault_agent] WARNING: VAULT_ADDR or VAULT_TOKEN not set. Skipping read.")
         return None
+    return f"{addr}/v1/{_kv_path()}", {"X-Vault-Token": token, "Content-Type": "application/json"}
+
 
-    url = f"{addr}/v1/{_kv_path()}/{secret_name}"
-    req = urllib.request.Request(
-        url,
-        headers={"X-Vault-Token": token},
-        method="GET",
-    )
-    try:
-        with urllib.request.urlopen(req, timeout=30) as resp:  # noqa: S310
-            data = json.loads(resp.read())
-            return data.get("data", {})
-    except urllib.error.HTTPError as exc:
-        print(f"[vault_agent] Read error {exc.code} when accessing Vault secret.", file=sys.stderr)
+def _vault_request(
+    method: str, secret_name: str, body: bytes | None = None
+) -> tuple[int, bytes] | None:
+    """Send one request for a secret. Returns (status, body), or None if Vault is not configured."""
+    client = _client()
+    if client is None:
         return None
+    base, headers = client
+    resp = _SESSION.request(method, f"{base}/{secret_name}", data=body, headers=headers, timeout=30)
+    return resp.status_code, resp.content
+
+
+def read_secret(secret_name: str) -> dict | None:
+    """Read a KV secret from Vault.
+
+    Returns the data dict, {} if the secret does not exist, or None on error.
+    """
+    result = _vault_request("GET", secret_name)
+    if result is None:
+        print("[vault_agent] WARNING: VAULT_ADDR or VAULT_TOKEN not set. Skipping read.")
+        return None
+    status, body = result
+    if status == 404:
+        return {}
+    if status >= 400:
+        print(f"[vault_agent] Read error {status} when accessing Vault secret.", file=sys.stderr)
+        return None
+    return loads(body).get("data", {})
 
 
 def write_secret(secret_name: str, payload: dict) -> bool:
     """Write a KV secret to Vault. Returns True on success."""
-    addr = _vault_url()
-    token = _vault_token()
-    if not addr or not token:
+    result = _vault_request("POST", secret_name, dumps(payload))
+    if result is None:
         print("[vault_agent] WARNING: VAULT_ADDR or VAULT_TOKEN not set. Skipping write.")
         return False
-
-    url = f"{addr}/v1/{_kv_path()}/{secret_name}"
-    body = json.dumps(payload).encode()
-    req = urllib.request.Request(
-        url,
-        data=body,
-        headers={"X-Vault-Token": token, "Content-Type": "application/json"},
-        method="POST",
-    )
-    try:
-        with urllib.request.urlopen(req, timeout=30) as resp:  # noqa: S310
-            print(f"[vault_agent] Secret write completed (HTTP {resp.status})")
-            return True
-    except urllib.error.HTTPError as exc:
-        print(f"[vault_agent] Secret write error (HTTP {exc.code})", file=sys.stderr)
+    status, _ = result
+    if status >= 400:
+        print(f"[vault_agent] Secret write error (HTTP {status})", file=sys.stderr)
         return False
+    print(f"[vault_agent] Secret write completed (HTTP {status})")
+    return True
+
+
+def write_secrets_batch(
+    secret_name: str, *payloads: dict, kv_version: int = 1, cas: int | None = None
+) -> bool:
+    """Merge several payloads into one secret and write it in a single request.
+
+    A field that appears in more than one payload raises ValueError rather
+    than being overwritten. kv_version=2 wraps the body as {"data": ...} for a
+    KV v2 mount (VAULT_KV_PATH must then be its data path, e.g.
+    secret/data/singularity); cas, the check-and-set version, is only valid
+    with kv_version=2.
+    """
+    if kv_version not in (1, 2):
+        raise ValueError(f"kv_version must be 1 or 2, not {kv_version!r}")
+    if cas is not None and kv_version != 2:
+        raise ValueError("cas requires kv_version=2")
+
+    merged: dict = {}
+    for payload in payloads:
+        duplicates = merged.keys() & payload.keys()
+        if duplicates:
+            raise ValueError(f"Duplicate secret fields in batch: {sorted(duplicates)}")
+        merged.update(payload)
+
+    if kv_version == 1:
+        return write_secret(secret_name, merged)
+    body: dict = {"data": merged}
+    if cas is not None:
+        body["options"] = {"cas": cas}
+    return write_secret(secret_name, body)
 
 
 def sync_release_to_vault() -> None:
@@ -90,11 +127,11 @@ def sync_release_to_vault() -> None:
         print("[vault_agent] state.json not found; skipping release sync.")
         return
 
-    state = json.loads(state_path.read_text(encoding="utf-8"))
+    state = load_json_cached(state_path)
     payload = {
         "current_state": state.get("current"),
         "version": state.get("version", "0.0.0"),
-        "synced_at": datetime.datetime.now(datetime.timezone.utc).isoformat().replace("+00:00", "Z"),
+        "synced_at": utcnow_iso_z(),
     }
     write_secret("release/latest", payload)
 
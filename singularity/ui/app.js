@@ -13,13 +13,15 @@
 // ─── Data paths (relative to Pages root) ───────────────────────────────────
 const PATHS = {
   state:      "../singularity/_STATE/state.json",
-  history:    "../singularity/_STATE/history.json",
+  history:    "../singularity/_STATE/history.jsonl",
+  historyOld: "../singularity/_STATE/history.json",
   transitions:"../singularity/_STATE/transitions.json",
   roadmap:    "../singularity/blueprint/roadmap.json",
   validation: "../singularity/evolution/validation_report.json",
   checklist:  "../singularity/evolution/checklist.json",
   tech:       "../singularity/evolution/tech_registry.json",
-  memory:     "../singularity/evolution/memory_registry.json",
+  memory:     "../singularity/evolution/memory_registry.ndjson",
+  memoryOld:  "../singularity/evolution/memory_registry.json",
 };
 
 // ─── Utility ────────────────────────────────────────────────────────────────
@@ -35,6 +37,19 @@ async function fetchJSON(path) {
   }
 }
 
+// Newline-delimited JSON (one object per line), used by append-only logs.
+async function fetchNDJSON(path) {
+  try {
+    const res = await fetch(path);
+    if (!res.ok) throw new Error(`HTTP ${res.status}`);
+    const text = await res.text();
+    return text.split("\n").filter(line => line.trim()).map(line => JSON.parse(line));
+  } catch (err) {
+    console.warn(`[sp-dashboard] Could not load ${path}:`, err.message);
+    return null;
+  }
+}
+
 function el(id) { return document.getElementById(id); }
 
 function esc(str) {
@@ -167,13 +182,13 @@ function renderTech(tech) {
   `).join("");
 }
 
-function renderMemory(memory) {
+function renderMemory(entries) {
   const tbody = el("memory-body");
-  if (!memory?.entries?.length) {
+  if (!entries?.length) {
     tbody.innerHTML = "<tr><td colspan='4'>No memory entries yet.</td></tr>";
     return;
   }
-  tbody.innerHTML = [...memory.entries].reverse().map(e => `
+  tbody.innerHTML = [...entries].reverse().map(e => `
     <tr>
       <td>${e.timestamp ? new Date(e.timestamp).toLocaleString() : "—"}</td>
       <td>${esc(e.event ?? "—")}</td>
@@ -185,10 +200,10 @@ function renderMemory(memory) {
 
 function renderStateHistory(history, transitions) {
   const tbody = el("history-body");
-  if (!history?.transitions?.length) {
+  if (!history?.length) {
     tbody.innerHTML = "<tr><td colspan='3'>No transitions recorded yet.</td></tr>";
   } else {
-    tbody.innerHTML = [...history.transitions].reverse().map(t => `
+    tbody.innerHTML = [...history].reverse().map(t => `
       <tr>
         <td><code>${esc(t.from)}</code></td>
         <td><code>${esc(t.to)}</code></td>
@@ -316,13 +331,13 @@ async function init() {
   const [state, history, transitions, roadmap, validation, checklist, tech, memory] =
     await Promise.all([
       fetchJSON(PATHS.state),
-      fetchJSON(PATHS.history),
+      fetchNDJSON(PATHS.history),
       fetchJSON(PATHS.transitions),
       fetchJSON(PATHS.roadmap),
       fetchJSON(PATHS.validation),
       fetchJSON(PATHS.checklist),
       fetchJSON(PATHS.tech),
-      fetchJSON(PATHS.memory),
+      fetchNDJSON(PATHS.memory),
     ]);
 
   renderOverview(state, validation, checklist, tech);
@@ -330,8 +345,11 @@ async function init() {
   renderValidation(validation);
   renderChecklist(checklist);
   renderTech(tech);
-  renderMemory(memory);
-  renderStateHistory(history, transitions);
+  // Deployments that predate the NDJSON log still have the single-document registry.
+  renderMemory(memory ?? (await fetchJSON(PATHS.memoryOld))?.entries);
+  // Deployments that predate history.jsonl still have the single-document log.
+  const historyEntries = history ?? (await fetchJSON(PATHS.historyOld))?.transitions;
+  renderStateHistory(historyEntries, transitions);
 }
 
 init().catch(err => console.error("[sp-dashboard] Init error:", err));